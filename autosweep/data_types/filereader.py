@@ -8,6 +8,8 @@ class GeneralIOClass(ABC):
     A base class to inherit from if the class you're building inside AutoSweep needs to perform disk or disk-like IO.
     """
 
+    __slots__ = ()
+
     @classmethod
     @abstractmethod
     def from_dict(cls, data: dict):
@@ -37,6 +39,8 @@ class FileWRer(GeneralIOClass):
     A class which classes that perform file read and writes inherit from.
     """
 
+    __slots__ = ("filename",)
+
     def __init__(self):
         self.filename = None
 
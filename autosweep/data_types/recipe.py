@@ -6,18 +6,36 @@ from autosweep.utils import io, typing_ext
 
 
 class Recipe(filereader.FileWRer):
+    """
+    A collection of tests to run and the instruments they need. The instruments and tests are read once when the
+    instance is created, editing the recipe dict afterwards is not reflected by instruments, tests() or equality.
+
+    :raise KeyError: If the recipe has no "instruments" or no "tests"
+    :param recipe: The recipe, with at least the "instruments" and "tests" keys
+    :type recipe: dict
+    """
+
+    # created once for the class rather than per instance
+    logger = logging.getLogger("Recipe")
+
+    __slots__ = ("recipe", "_instruments", "_tests")
+
     def __init__(self, recipe: dict):
         super().__init__()
-        self.logger = logging.getLogger(self.__class__.__name__)
 
         self.recipe = recipe
+        self._instruments = tuple(recipe["instruments"])
+        self._tests = tuple(tuple(test) for test in recipe["tests"])
 
     @classmethod
     def from_dict(cls, data: dict):
         return cls(recipe=data)
 
     def __eq__(self, other):
-        return self.recipe == other.recipe if isinstance(other, Recipe) else False
+        if not isinstance(other, Recipe):
+            return False
+        # cheap check on the cached instruments before comparing the whole recipe
+        return self._instruments == other._instruments and self.recipe == other.recipe
 
     @property
     def instruments(self) -> tuple[str]:
@@ -27,7 +45,7 @@ class Recipe(filereader.FileWRer):
         :return: The instrument instance names needed
         :rtype: tuple[str]
         """
-        return tuple(self.recipe["instruments"])
+        return self._instruments
 
     def to_json(self, path: typing_ext.PathLike):
         io.write_json(data=self.recipe, path=path)
@@ -39,7 +57,7 @@ class Recipe(filereader.FileWRer):
         """
         Used to iterate over tests.
 
-        :yields: tuple[str, dict]
+        :return: An iterator over the (name, parameters) pairs
+        :rtype: Iterable[tuple[str, dict]]
         """
-        for test in self.recipe["tests"]:
-            yield tuple(test)
+        return iter(self._tests)
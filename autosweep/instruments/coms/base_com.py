@@ -11,5 +11,24 @@ class BaseCOM:
     def query(self) -> None:
         raise NotImplementedError
 
+    def query_many(self, cmds: list[str]) -> list[str]:
+        """
+        Sends several queries as a single semicolon-chained command and splits the response, so that N queries cost a
+        single round-trip to the instrument. Only meant for queries with numeric (or otherwise ';'-free) replies, a
+        reply containing ';' would be split in several.
+
+        :raise ValueError: If the number of replies does not match the number of queries
+        :param cmds: The queries to send, in order
+        :type cmds: list[str]
+        :return: The responses, in the same order as the queries
+        :rtype: list[str]
+        """
+        resp = self.query(";".join(cmds)).strip().split(";")
+        if len(resp) != len(cmds):
+            raise ValueError(
+                f"Expected {len(cmds)} responses to '{';'.join(cmds)}', got {len(resp)}"
+            )
+        return resp
+
     def close(self) -> None:
         raise NotImplementedError
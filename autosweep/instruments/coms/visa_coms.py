@@ -1,3 +1,6 @@
+import contextlib
+from collections.abc import Iterator
+
 import pyvisa
 
 from autosweep.instruments.coms import base_com
@@ -23,14 +26,113 @@ class VisaCOM(base_com.BaseCOM):
             )
         self.addrs = addrs
 
+        # pending commands while a batch is open, None otherwise
+        self._batch = None
+        self._batch_depth = 0
+
     def write(self, cmd: str) -> None:
-        self.com.write(cmd)
+        if self._batch is not None:
+            self._batch.append(cmd)
+        else:
+            self.com.write(cmd)
 
     def read(self) -> str:
+        # pending writes must reach the instrument before anything is read back
+        self.flush()
         return self.com.read()
 
     def query(self, cmd: str) -> None:
+        self.flush()
         return self.com.query(cmd)
 
+    def query_binary_values(self, cmd: str, **kwargs) -> list:
+        """
+        Queries the instrument for a block of binary values, see pyvisa's Resource.query_binary_values for the
+        arguments.
+
+        :param cmd: The query to send
+        :type cmd: str
+        :param kwargs: Passed on to pyvisa's query_binary_values
+        :type kwargs: dict
+        :return: The values read
+        :rtype: list
+        """
+        self.flush()
+        return self.com.query_binary_values(cmd, **kwargs)
+
+    def query_raw(self, cmd: str) -> bytes:
+        """
+        Queries the instrument and reads the response as raw bytes, for replies which are not terminated text.
+
+        :param cmd: The query to send
+        :type cmd: str
+        :return: The bytes read
+        :rtype: bytes
+        """
+        self.flush()
+        self.com.write(cmd)
+        return self.com.read_raw()
+
+    def begin_batch(self) -> None:
+        """
+        Starts buffering the written commands instead of sending them one by one. Batches can be nested, the commands
+        are sent when the outermost batch ends.
+
+        :return: None
+        """
+        if self._batch is None:
+            self._batch = []
+        self._batch_depth += 1
+
+    def end_batch(self) -> None:
+        """
+        Ends a batch started with begin_batch(). When the outermost batch ends, the buffered commands are sent.
+
+        :raise RuntimeError: If no batch is open
+        :return: None
+        """
+        if not self._batch_depth:
+            raise RuntimeError("end_batch() called without a matching begin_batch()")
+        self._batch_depth -= 1
+        if not self._batch_depth:
+            try:
+                self.flush()
+            finally:
+                # even if the flush failed, later writes must be sent directly again
+                self._batch = None
+
+    def flush(self) -> None:
+        """
+        Sends the buffered commands, if any, as a single semicolon-chained command followed by "*OPC?", and waits for
+        the instrument to report that they are complete.
+
+        :return: None
+        """
+        if not self._batch:
+            return
+
+        # commands without a leading colon would be relative to the previous one once chained
+        cmds = [c if c.startswith((":", "*")) else f":{c}" for c in self._batch]
+        self._batch.clear()
+        self.com.query(";".join(cmds) + ";*OPC?")
+
+    @contextlib.contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Context manager around begin_batch() and end_batch(). If an exception is raised inside the context, the
+        commands buffered inside it are discarded, those buffered before by an enclosing batch are kept.
+
+        :return: None
+        """
+        self.begin_batch()
+        start = len(self._batch)
+        try:
+            yield
+        except BaseException:
+            del self._batch[start:]
+            raise
+        finally:
+            self.end_batch()
+
     def close(self) -> None:
         self.com.close()
@@ -89,7 +89,7 @@ class KeysightN7745C(abs_instr.AbsInstrument):
 
         :return: Data values are always in Watt. (Seems no to be the case)
         """
-        return self.com.com.query_binary_values(
+        return self.com.query_binary_values(
             ":FETCH:POWER:ALL?", datatype="f", is_big_endian=False
         )
 
@@ -115,7 +115,7 @@ class KeysightN7745C(abs_instr.AbsInstrument):
         :return The values are ordered by channel.
                 Data values are always in Watt.
         """
-        return self.com.com.query_binary_values(
+        return self.com.query_binary_values(
             ":READ:POWER:ALL?", datatype="f", is_big_endian=False
         )
 
@@ -186,7 +186,7 @@ class KeysightN7745C(abs_instr.AbsInstrument):
         This can happen when the measurement isn't ready / never triggered
         """
         result = np.array(
-            self.com.com.query_binary_values(
+            self.com.query_binary_values(
                 ":SENSE:FUNCTION:RESULT?", datatype="f", is_big_endian=False
             )
         )
@@ -189,8 +189,7 @@ class KeysightN777C(abs_instr.AbsInstrument):
 
 
         """
-        self.com.com.write(":sour0:read:data? pmax")
-        data_raw = self.com.com.read_raw()
+        data_raw = self.com.query_raw(":sour0:read:data? pmax")
         data = data_raw
 
         SIZE_WL_VALUE = 8
@@ -1,3 +1,5 @@
+import asyncio
+import threading
 import warnings
 
 import numpy as np
@@ -5,6 +7,9 @@ import numpy as np
 from autosweep.instruments import abs_instr
 from autosweep.instruments.coms import visa_coms
 
+# power units, indexed by the value returned by ":POL:POW:UNIT?"
+_POW_UNITS = ("dBm", "Watts")
+
 
 class KeysightN778C(abs_instr.AbsInstrument):
     """
@@ -29,6 +34,15 @@ class KeysightN778C(abs_instr.AbsInstrument):
         self.clear_errors()
         self.assert_errors()
 
+        # the available wavelength range is fixed per model, only query it once
+        self._wl_min_nm = None
+        self._wl_max_nm = None
+        self._query_wl_bounds_nm()
+
+        # held by the async methods around their transfer, so that two of them
+        # running in worker threads never interleave commands on the same COM
+        self._com_lock = threading.Lock()
+
     def idn_ask(self):
         return self.com.query("*IDN?").strip()
 
@@ -77,6 +91,27 @@ class KeysightN778C(abs_instr.AbsInstrument):
     def model(self):
         return self.idn_ask_dict()["model"]
 
+    @staticmethod
+    def _parse_stokes_params(resp: str, normalized: bool):
+        """
+        Parses a comma-separated S0, S1, S2, S3 response.
+
+        Args:
+            - Response from the instrument
+            - If normalized parameters should be returned
+
+        Returns:
+            S0, S1, S2, S3 if not normalized
+            s1, s2, s3 if normalized
+        """
+        S = np.fromstring(resp, sep=",")
+        if S.size != 4:
+            raise ValueError(f"Expected 4 stokes parameters, got {resp.strip()!r}")
+        if normalized:
+            return S[1:] / S[0]
+        else:
+            return S
+
     def measure_stokes_params(self, normalized: bool = True):
         """
         Returns the measured S0, S1, S2 and S3 stokes parameter.
@@ -88,12 +123,7 @@ class KeysightN778C(abs_instr.AbsInstrument):
             S0, S1, S2, S3 if not normalized
             s1, s2, s3 if normalized
         """
-        S_list = self.com.query(":POL:SOP?").strip().split(",")
-        S0, S1, S2, S3 = (float(Selem) for Selem in S_list)
-        if normalized:
-            return S1 / S0, S2 / S0, S3 / S0
-        else:
-            return S0, S1, S2, S3
+        return self._parse_stokes_params(self.com.query(":POL:SOP?"), normalized)
 
     def fetch_stokes_params(self, normalized: bool = True):
         """
@@ -107,12 +137,55 @@ class KeysightN778C(abs_instr.AbsInstrument):
             S0, S1, S2, S3 if not normalized
             s1, s2, s3 if normalized
         """
-        S_list = self.com.query(":POL:SOP:FETCH?").strip().split(",")
-        S0, S1, S2, S3 = (float(Selem) for Selem in S_list)
-        if normalized:
-            return S1 / S0, S2 / S0, S3 / S0
-        else:
-            return S0, S1, S2, S3
+        return self._parse_stokes_params(self.com.query(":POL:SOP:FETCH?"), normalized)
+
+    def _call_locked(self, func, *args):
+        """
+        Calls func while holding the COM lock of this instrument.
+
+        Args:
+            - The method to call
+            - Its arguments
+
+        Returns:
+            What func returns
+        """
+        with self._com_lock:
+            return func(*args)
+
+    async def fetch_stokes_params_async(self, normalized: bool = True):
+        """
+        Same as fetch_stokes_params, but the blocking VISA transfer runs
+        in a worker thread so that fetches from several instruments can
+        overlap inside an asyncio event loop. Async calls on the same
+        instrument are serialised.
+
+        Args:
+            If normalized parameters should be returned
+
+        Returns:
+            S0, S1, S2, S3 if not normalized
+            s1, s2, s3 if normalized
+        """
+        return await asyncio.to_thread(
+            self._call_locked, self.fetch_stokes_params, normalized
+        )
+
+    def measure_stokes_params_and_power(self, normalized: bool = True):
+        """
+        Returns the measured stokes parameters and optical power
+        using a single query.
+
+        Args:
+            If normalized parameters should be returned
+
+        Returns:
+            - S0, S1, S2, S3 if not normalized
+              s1, s2, s3 if normalized
+            - Measurement optical power
+        """
+        sop, power = self.com.query_many([":POL:SOP?", ":POL:POW?"])
+        return self._parse_stokes_params(sop, normalized), float(power)
 
     def measure_optical_power(self):
         """
@@ -150,11 +223,34 @@ class KeysightN778C(abs_instr.AbsInstrument):
         Returns:
             Power unit
         """
-        raw = self.com.query(":POL:POW:UNIT?").strip()
-        return {
-            "0": "dBm",
-            "1": "Watts",
-        }[raw]
+        raw = self.com.query(":POL:POW:UNIT?")
+        idx = int(raw)
+        if not (0 <= idx < len(_POW_UNITS)):
+            raise ValueError(f"Unexpected power unit {raw.strip()!r}")
+        return _POW_UNITS[idx]
+
+    def _query_wl_bounds_nm(self):
+        """
+        Returns the available wavelength range, querying the instrument
+        only if it is not cached yet.
+
+        Returns:
+            Minimum and maximum available wavelength [nm]
+        """
+        if self._wl_min_nm is None or self._wl_max_nm is None:
+            self._wl_min_nm, self._wl_max_nm = (
+                float(resp) * 1e9
+                for resp in self.com.query_many([":POL:WAV? MIN", ":POL:WAV? MAX"])
+            )
+        return self._wl_min_nm, self._wl_max_nm
+
+    def invalidate_wl_cache(self):
+        """
+        Clears the cached available wavelength range,
+        it will be queried again on next use.
+        """
+        self._wl_min_nm = None
+        self._wl_max_nm = None
 
     def set_wavelength_nm(self, wl: float):
         """
@@ -163,8 +259,7 @@ class KeysightN778C(abs_instr.AbsInstrument):
         Args:
             Wavelength [nm]
         """
-        min_wl = float(self.com.query(":POL:WAV? MIN")) * 1e9
-        max_wl = float(self.com.query(":POL:WAV? MAX")) * 1e9
+        min_wl, max_wl = self._query_wl_bounds_nm()
 
         if not (min_wl < wl < max_wl):
             raise ValueError(
@@ -181,7 +276,7 @@ class KeysightN778C(abs_instr.AbsInstrument):
         Args:
             Wavelength [nm]
         """
-        min_avail_wl = float(self.com.query(":POL:WAV? MIN")) * 1e9
+        min_avail_wl, _ = self._query_wl_bounds_nm()
         if not (min_avail_wl <= wl):
             raise ValueError(f"Wavelength need to be above{min_avail_wl}nm.")
 
@@ -194,7 +289,7 @@ class KeysightN778C(abs_instr.AbsInstrument):
         Args:
             Wavelength [nm]
         """
-        max_avail_wl = float(self.com.query(":POL:WAV? MAX")) * 1e9
+        _, max_avail_wl = self._query_wl_bounds_nm()
         if not (wl <= max_avail_wl):
             raise ValueError(f"Wavelength need to be below{max_avail_wl}nm.")
 
@@ -254,8 +349,7 @@ class KeysightN778C(abs_instr.AbsInstrument):
         Args:
             If autogain should be set on (True) or turned off (False)
         """
-        agflag = 1 if val else 0
-        self.com.write(f":POL:AGFL {agflag}")
+        self.com.write(":POL:AGFL 1" if val else ":POL:AGFL 0")
 
     def ask_auto_gain_state(self):
         """
@@ -352,31 +446,38 @@ class KeysightN778C(abs_instr.AbsInstrument):
             NORMalized: returns 3,* dimensional array with S1, S2, S3
         """
         if val is None:
-            return np.array(
-                self.com.com.query_binary_values(
-                    ":POL:SWE:GET?", datatype="f", is_big_endian=False
-                )
-                .reshape((-1, 4))
-                .T
-            )
-        val = val.upper()
-        assert val in ("SOP", "NORM", "NORMALIZED")
-        if val == "SOP":
-            return np.array(
-                self.com.com.query_binary_values(
-                    ":POL:SWE:GET? SOP", datatype="f", is_big_endian=False
-                )
-                .reshape((-1, 4))
-                .T
-            )
+            cmd, n_params = ":POL:SWE:GET?", 4
         else:
-            return np.array(
-                self.com.com.query_binary_values(
-                    ":POL:SWE:GET? NORM", datatype="f", is_big_endian=False
-                )
-                .reshape((-1, 3))
-                .T
+            val = val.upper()
+            assert val in ("SOP", "NORM", "NORMALIZED")
+            if val == "SOP":
+                cmd, n_params = ":POL:SWE:GET? SOP", 4
+            else:
+                cmd, n_params = ":POL:SWE:GET? NORM", 3
+
+        return (
+            np.array(
+                self.com.query_binary_values(cmd, datatype="f", is_big_endian=False)
             )
+            .reshape((-1, n_params))
+            .T
+        )
+
+    async def get_measured_stokes_params_async(self, val: str = None):
+        """
+        Same as get_measured_stokes_params, but the blocking VISA transfer
+        runs in a worker thread so that long logging fetches from several
+        instruments can overlap inside an asyncio event loop. Async calls
+        on the same instrument are serialised.
+
+        Returns:
+            None: returns 4,* dimensional array with S0, S1, S2, S3
+            SOP: returns 4,* dimensional array with S0, S1, S2, S3
+            NORMalized: returns 3,* dimensional array with S1, S2, S3
+        """
+        return await asyncio.to_thread(
+            self._call_locked, self.get_measured_stokes_params, val
+        )
 
     def get_measured_power(self):
         """
@@ -386,7 +487,7 @@ class KeysightN778C(abs_instr.AbsInstrument):
             Numpy array of power [Watt]
         """
         return np.array(
-            self.com.com.query_binary_values(
+            self.com.query_binary_values(
                 ":POL:FUNC:RES?", datatype="f", is_big_endian=False
             )
         )
@@ -766,8 +867,7 @@ class KeysightN778C(abs_instr.AbsInstrument):
             If stabilization should be enable True
             or disabled False
         """
-        stabflag = 1 if val else 0
-        self.com.write(f":STAB:STAB {stabflag}")
+        self.com.write(":STAB:STAB 1" if val else ":STAB:STAB 0")
 
     def ask_stabilizer_mode(self):
         """
@@ -798,8 +898,11 @@ class KeysightN778C(abs_instr.AbsInstrument):
             - s2, normalized Stokes vector
             - s3, normalized Stokes vector
         """
-        s1, s2, s3 = self.com.query(":STAB:SOP?").strip().split(",")
-        return float(s1), float(s2), float(s3)
+        resp = self.com.query(":STAB:SOP?")
+        target = np.fromstring(resp, sep=",")
+        if target.size != 3:
+            raise ValueError(f"Expected 3 stokes parameters, got {resp.strip()!r}")
+        return target
 
 
 if __name__ == "__main__":
@@ -5,6 +5,7 @@ from autosweep.sweep.io import (
 )
 from autosweep.sweep.sweep_parser import (
     Sweep,
+    SweepXY,
 )
 from autosweep.sweep.vis_utils import (
     FigHandler,
@@ -13,6 +14,7 @@ from autosweep.sweep.vis_utils import (
 __all__ = [
     "FigHandler",
     "Sweep",
+    "SweepXY",
     "io",
     "read_json",
     "sweep_parser",
@@ -11,7 +11,10 @@ from autosweep.utils import ta_math
 class Sweep(filereader.GeneralIOClass):
     """
     A class used to manipulate test data, usually taken as a sweep (IV, laser power meter, etc.). Simplifies handling
-    metadta, units and import/export.
+    metadta, units and import/export. The trace data is stored in a single contiguous (n_traces, len) array, each trace
+    being a row of it. Indexing a Sweep returns a view of that row, not a copy. As they share one array, the traces
+    are promoted to a common data type: an int x-trace next to float y-traces is stored as float64, and a single
+    string trace turns every trace into strings.
 
     :param traces: The collection of data from the sweep, in ch-name (key) - values (value) pairs.
     :type traces: dict
@@ -19,13 +22,34 @@ class Sweep(filereader.GeneralIOClass):
     :type attrs: dict, optional
     :param metadata: Any additional metadata specific to this sweep
     :type metadata: dict, optional
+    :param monotonic_x: If True, the x-trace is known to be sorted and its range is taken from its end points rather
+        than from a full scan
+    :type monotonic_x: bool, default False
     """
 
+    # shared by every instance, avoids going through the logging manager lock each time
+    logger = logging.getLogger("Sweep")
+
+    __slots__ = (
+        "metadata",
+        "_attrs",
+        "_data",
+        "_cols",
+        "_idx",
+        "_aliases",
+        "_rev_aliases",
+        "_ranges",
+        "_len",
+        "_monotonic_x",
+    )
+
     def __init__(
-        self, traces: dict, attrs: dict | None = None, metadata: dict | None = None
+        self,
+        traces: dict,
+        attrs: dict | None = None,
+        metadata: dict | None = None,
+        monotonic_x: bool = False,
     ):
-        self.logger = logging.getLogger(self.__class__.__name__)
-
         # checks on input types and shapes
         if not isinstance(traces, dict):
             raise TypeError("The argument 'traces' must be a dict.")
@@ -41,25 +65,39 @@ class Sweep(filereader.GeneralIOClass):
             self._attrs = {k: tuple(attr) for k, attr in attrs.items()}
 
         # parsing data
-        self._traces = {k: np.array(v) for k, v in traces.items()}
+        arrays = tuple(np.asarray(v) for v in traces.values())
 
-        t_keys = tuple(self._traces.keys())
-        self._aliases = {"x": t_keys[0], "y": t_keys[1]} | {
-            f"y{ii}": k for ii, k in enumerate(t_keys[1:])
+        self._cols = tuple(traces.keys())
+        self._aliases = {"x": self._cols[0], "y": self._cols[1]} | {
+            f"y{ii}": k for ii, k in enumerate(self._cols[1:])
         }
-        self._ranges = {}
-        self._len = len(self["x"])
-        self._col_num = len(self._traces)
-        for k, v in self._traces.items():
-            self._ranges[k] = (np.min(v), np.max(v))
-
-            # double check that every column has the same length
-            if len(v) != self._len:
-                msg = (
-                    f"Trace '{k}' does not have the same length as the x-trace. Every trace must have the same "
-                    f"length."
-                )
-                raise ValueError(msg)
+        self._rev_aliases = {v: k for k, v in self._aliases.items()}
+        # row index of every trace name and alias, aliases take precedence
+        self._idx = {k: ii for ii, k in enumerate(self._cols)}
+        self._idx |= {a: self._idx[k] for a, k in self._aliases.items()}
+        self._len = len(arrays[0])
+
+        # double check that every column has the same length
+        lens = np.fromiter((len(v) for v in arrays), dtype=np.int64, count=len(arrays))
+        bad = np.flatnonzero(lens != self._len)
+        if bad.size:
+            k = self._cols[bad[0]]
+            msg = (
+                f"Trace '{k}' does not have the same length as the x-trace. Every trace must have the same "
+                f"length."
+            )
+            raise ValueError(msg)
+
+        self._data = np.stack(arrays)
+        self._monotonic_x = monotonic_x
+        if monotonic_x:
+            # only the y-traces need to be scanned
+            x_ends = (self._data[0, 0], self._data[0, -1])
+            x_range = (min(x_ends), max(x_ends))
+            y_ranges = zip(*ta_math.min_max(self._data[1:]))
+            self._ranges = dict(zip(self._cols, (x_range, *y_ranges)))
+        else:
+            self._ranges = dict(zip(self._cols, zip(*ta_math.min_max(self._data))))
 
         self.metadata = metadata if metadata else {}
 
@@ -73,7 +111,34 @@ class Sweep(filereader.GeneralIOClass):
         :return: A sweep instance
         :rtype: autosweep.sweep.sweep_parser.Sweep
         """
-        return Sweep(**data)
+        return Sweep.create(**data)
+
+    @classmethod
+    def create(
+        cls,
+        traces: dict,
+        attrs: dict | None = None,
+        metadata: dict | None = None,
+        monotonic_x: bool = False,
+    ):
+        """
+        Creates the most specific Sweep for the traces, a SweepXY if there is a single y-trace and a Sweep otherwise.
+
+        :param traces: The collection of data from the sweep, in ch-name (key) - values (value) pairs.
+        :type traces: dict
+        :param attrs: The collection of trace attributes, with the same channel names as the traces
+        :type attrs: dict, optional
+        :param metadata: Any additional metadata specific to this sweep
+        :type metadata: dict, optional
+        :param monotonic_x: If True, the x-trace is known to be sorted
+        :type monotonic_x: bool, default False
+        :return: A sweep instance
+        :rtype: autosweep.sweep.sweep_parser.Sweep
+        """
+        sweep_cls = SweepXY if isinstance(traces, dict) and len(traces) == 2 else Sweep
+        return sweep_cls(
+            traces=traces, attrs=attrs, metadata=metadata, monotonic_x=monotonic_x
+        )
 
     def __str__(self) -> str:
         return self.__repr__()
@@ -91,7 +156,11 @@ class Sweep(filereader.GeneralIOClass):
         return self._len
 
     def __getitem__(self, item):
-        return self._traces[self.get_trace_col(col=item)]
+        # single lookup instead of get_trace_col(), this is called in tight loops
+        try:
+            return self._data[self._idx[item]]
+        except KeyError:
+            raise KeyError(f"The trace '{item}' does not exist") from None
 
     @property
     def shape(self) -> tuple[int, int]:
@@ -101,7 +170,7 @@ class Sweep(filereader.GeneralIOClass):
         :return: The number of traces and the length of the traces
         :rtype: tuple[int, int]
         """
-        return self._col_num, self._len
+        return self._data.shape
 
     @property
     def attrs(self) -> dict[str, tuple]:
@@ -135,7 +204,7 @@ class Sweep(filereader.GeneralIOClass):
         :return: The name of the Y columns of the trace data
         :rtype: tuple[str]
         """
-        return tuple(self._traces.keys())[1:]
+        return self._cols[1:]
 
     def itercols(self) -> Iterable[tuple[str, np.ndarray, np.ndarray]]:
         """
@@ -161,7 +230,7 @@ class Sweep(filereader.GeneralIOClass):
         """
         if col in self._aliases:
             return self._aliases[col]
-        elif col in self._traces:
+        elif col in self._idx:
             return col
         else:
             raise KeyError(f"The trace '{col}' does not exist")
@@ -174,7 +243,11 @@ class Sweep(filereader.GeneralIOClass):
         :return: The data needed to save to disk to recreate the instance
         :rtype: dict
         """
-        return {"traces": self._traces, "attrs": self.attrs, "metadata": self.metadata}
+        return {
+            "traces": dict(zip(self._cols, self._data)),
+            "attrs": self.attrs,
+            "metadata": self.metadata,
+        }
 
     def get_axis_labels(self, use_generic_names: bool = False) -> dict[str, str]:
         """
@@ -186,19 +259,14 @@ class Sweep(filereader.GeneralIOClass):
         :return: The axis labels generated from the attributes
         :rtype: dict[str, str]
         """
-        labels = {}
         if not self.attrs:
             raise Exception("No axis labels without Sweep attributes")
 
-        if use_generic_names:
-            keys = dict(map(reversed, self._aliases.items()))
-
-        for k, v in self.attrs.items():
-            if use_generic_names:
-                k = keys[k]
-
-            labels[k] = f"{v[0]} ({v[1]})" if len(v) == 2 else v[0]
-        return labels
+        keys = self._rev_aliases if use_generic_names else {}
+        return {
+            keys.get(k, k): f"{v[0]} ({v[1]})" if len(v) == 2 else v[0]
+            for k, v in self.attrs.items()
+        }
 
     def change_unit(
         self, col: str, coeff: float, unit: str | None = None, desc: str | None = None
@@ -207,6 +275,11 @@ class Sweep(filereader.GeneralIOClass):
         This method can change the scaling of a trace, it's unit, and its description. For example to change the
         a trace from 'V' to 'mV', the coeff is 1000 and the unit is 'mV'.
 
+        When the data type allows it, the trace is scaled in place, so arrays previously obtained by indexing the Sweep
+        show the new values; copy them beforehand to keep the old ones. As all the traces share a single array, when the
+        coefficient needs a wider data type (e.g. a float coefficient for integer data), every trace is converted to
+        that data type in a new array, and previously obtained arrays are left as they were.
+
         :param col: The trace name to apply this operation to
         :type col: str
         :param coeff: The coefficient to apply to every element of the trace data
@@ -218,7 +291,11 @@ class Sweep(filereader.GeneralIOClass):
         :return: None
         """
         col = self.get_trace_col(col=col)
-        self._traces[col] = coeff * self._traces[col]
+        dtype = np.result_type(self._data, coeff)
+        if not np.can_cast(dtype, self._data.dtype):
+            # e.g. integer data scaled by a float coefficient
+            self._data = self._data.astype(dtype)
+        self._data[self._idx[col]] *= coeff
 
         if self.attrs:
             if unit:
@@ -242,11 +319,12 @@ class Sweep(filereader.GeneralIOClass):
         idx_min = ta_math.find_nearest_idx(array=self["x"], val=x_min)
         idx_max = ta_math.find_nearest_idx(array=self["x"], val=x_max)
 
-        traces = {col: trace[idx_min:idx_max] for col, trace in self._traces.items()}
-        return Sweep(
+        traces = dict(zip(self._cols, self._data[:, idx_min:idx_max]))
+        return Sweep.create(
             traces=traces,
             attrs=self.attrs if self.attrs else None,
             metadata=self.metadata if self.metadata else None,
+            monotonic_x=self._monotonic_x,
         )
 
     # def find_x_intercept(self, val: float, y_col: str):
@@ -261,3 +339,74 @@ class Sweep(filereader.GeneralIOClass):
     # #
     # # def find_fft(self, y_col: str):
     # #     raise NotImplementedError
+
+
+class SweepXY(Sweep):
+    """
+    A Sweep specialized for the common case of a single y-trace. The x and y traces are also held as read-only
+    attributes, so that indexing them does not need any lookup. Use Sweep.create() to get one when the traces allow it.
+
+    :raise ValueError: If there are not exactly 2 traces
+
+    :param traces: The collection of data from the sweep, in ch-name (key) - values (value) pairs. Must have exactly 2
+        traces.
+    :type traces: dict
+    :param attrs: The collection of trace attributes, with the same channel names as the traces
+    :type attrs: dict, optional
+    :param metadata: Any additional metadata specific to this sweep
+    :type metadata: dict, optional
+    :param monotonic_x: If True, the x-trace is known to be sorted and its range is taken from its end points rather
+        than from a full scan
+    :type monotonic_x: bool, default False
+    """
+
+    __slots__ = ("_x", "_y")
+
+    def __init__(
+        self,
+        traces: dict,
+        attrs: dict | None = None,
+        metadata: dict | None = None,
+        monotonic_x: bool = False,
+    ):
+        if isinstance(traces, dict) and len(traces) != 2:
+            raise ValueError("A SweepXY must have exactly 2 traces.")
+
+        super().__init__(
+            traces=traces, attrs=attrs, metadata=metadata, monotonic_x=monotonic_x
+        )
+        self._x, self._y = self._data
+
+    @property
+    def x(self) -> np.ndarray:
+        """
+        Accessor for the x-trace data
+
+        :return: A view of the x-trace
+        :rtype: np.ndarray
+        """
+        return self._x
+
+    @property
+    def y(self) -> np.ndarray:
+        """
+        Accessor for the y-trace data
+
+        :return: A view of the y-trace
+        :rtype: np.ndarray
+        """
+        return self._y
+
+    def __getitem__(self, item):
+        if item == "x":
+            return self._x
+        if item == "y":
+            return self._y
+        return super().__getitem__(item)
+
+    def change_unit(
+        self, col: str, coeff: float, unit: str | None = None, desc: str | None = None
+    ) -> None:
+        super().change_unit(col=col, coeff=coeff, unit=unit, desc=desc)
+        # the data may have been re-allocated with a new dtype
+        self._x, self._y = self._data
@@ -47,7 +47,7 @@ class VirtualTest(AbsTest):
         traces = {"v": v, "i0": v / 10, "i1": v / 20}
         attrs = {"v": ("Voltage", "V"), "i0": ("Current", "A"), "i1": ("Current", "A")}
 
-        s = sweep.Sweep(traces=traces, attrs=attrs)
+        s = sweep.Sweep(traces=traces, attrs=attrs, monotonic_x=True)
         sleep(2)
 
         self.save_data(sweeps={"iv": s}, metadata=None)
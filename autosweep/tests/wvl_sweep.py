@@ -67,7 +67,7 @@ class WvlSweep(AbsTest):
             "p2": ("Power", "dBm"),
         }
 
-        s = sweep.Sweep(traces=traces, attrs=attrs)
+        s = sweep.Sweep(traces=traces, attrs=attrs, monotonic_x=True)
         self.save_data(sweeps={"wvl": s}, metadata=None)
 
     def run_analysis(self, report_headings: list):
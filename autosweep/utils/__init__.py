@@ -27,6 +27,7 @@ from autosweep.utils.ta_math import (
     find_3_idxs,
     find_nearest_idx,
     get_grid,
+    min_max,
 )
 from autosweep.utils.typing_ext import (
     ListLike,
@@ -51,6 +52,7 @@ __all__ = [
     "logger",
     "logger_format",
     "logger_level",
+    "min_max",
     "params",
     "read_json",
     "register_classes",
@@ -37,7 +37,8 @@ def read_json(path: typing_ext.PathLike) -> dict:
     :return: The contents of the JSON file
     :rtype: dict
     """
-    with open(path) as f:
+    # orjson parses bytes directly, no need to decode to str first
+    with open(path, "rb") as f:
         raw = f.read()
 
     return orjson.loads(raw)
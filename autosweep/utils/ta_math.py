@@ -55,3 +55,15 @@ def get_grid(start: float, stop: float, step: float) -> np.ndarray:
     """
 
     return np.linspace(start, stop, int(np.abs(np.abs(start - stop) / step)))
+
+
+def min_max(array: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Find the minimum and maximum of every row of a 2D array. NaN values propagate like in np.min and np.max.
+
+    :param array: The array to search, of shape (n_rows, n_cols)
+    :type array: np.ndarray
+    :return: The minimum and the maximum of each row
+    :rtype: tuple[np.ndarray, np.ndarray]
+    """
+    return array.min(axis=1), array.max(axis=1)
@@ -0,0 +1,30 @@
+import numpy as np
+import pytest
+
+from autosweep.utils.ta_math import min_max
+
+
+def test_min_max():
+    a = np.array([[3.0, -1.0, 2.0], [0.5, 0.25, 1.0]])
+    mins, maxs = min_max(a)
+    np.testing.assert_array_equal(mins, [-1.0, 0.25])
+    np.testing.assert_array_equal(maxs, [3.0, 1.0])
+
+
+def test_min_max_int():
+    mins, maxs = min_max(np.arange(12).reshape(3, 4))
+    assert mins.dtype == maxs.dtype == np.arange(1).dtype
+    np.testing.assert_array_equal(mins, [0, 4, 8])
+    np.testing.assert_array_equal(maxs, [3, 7, 11])
+
+
+def test_min_max_nan():
+    a = np.array([[np.nan, 1.0, 2.0], [1.0, np.nan, 2.0], [1.0, 2.0, 3.0]])
+    mins, maxs = min_max(a)
+    np.testing.assert_array_equal(mins, [np.nan, np.nan, 1.0])
+    np.testing.assert_array_equal(maxs, [np.nan, np.nan, 3.0])
+
+
+def test_min_max_empty():
+    with pytest.raises(ValueError):
+        min_max(np.empty((2, 0)))
@@ -1,6 +1,8 @@
 import logging
 import pathlib
 
+import pytest
+
 from autosweep.data_types.metadata import PN, SN, DUTInfo, TimeStamp
 from autosweep.data_types.recipe import Recipe
 from autosweep.utils.logger import init_logger
@@ -41,5 +43,22 @@ def test_types():
     assert r == r2, "Recipes should match"
 
 
+def test_recipe():
+    dirpath = pathlib.Path(__file__).parent.absolute()
+    r = Recipe.read_json(dirpath / "recipe.json")
+
+    assert r.instruments == ("virt_instr",)
+    tests = list(r.tests())
+    assert [n for n, _ in tests] == ["abc"]
+    assert list(r.tests()) == tests, "tests() can be iterated over several times"
+
+    assert r != Recipe(recipe=r.recipe | {"instruments": ["other_instr"]})
+
+    with pytest.raises(KeyError):
+        Recipe(recipe={"instruments": ["virt_instr"]})
+    with pytest.raises(KeyError):
+        Recipe(recipe={"tests": []})
+
+
 if __name__ == "__main__":
     test_types()
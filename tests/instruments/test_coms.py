@@ -0,0 +1,144 @@
+import pytest
+
+from autosweep.instruments.coms import visa_coms
+from autosweep.instruments.coms.base_com import BaseCOM
+
+
+class StubCOM(BaseCOM):
+    def __init__(self, reply: str):
+        super().__init__()
+        self.reply = reply
+        self.sent = []
+
+    def query(self, cmd: str) -> str:
+        self.sent.append(cmd)
+        return self.reply
+
+
+def test_query_many():
+    com = StubCOM(reply="1.5E-6;1.6E-6\n")
+    assert com.query_many([":POL:WAV? MIN", ":POL:WAV? MAX"]) == ["1.5E-6", "1.6E-6"]
+    assert com.sent == [":POL:WAV? MIN;:POL:WAV? MAX"]
+
+
+def test_query_many_count_mismatch():
+    com = StubCOM(reply="1;2;3")
+    with pytest.raises(ValueError, match="Expected 2 responses"):
+        com.query_many([":A?", ":B?"])
+
+
+class StubResource:
+    def __init__(self):
+        self.sent = []
+        self.fail = False
+
+    def write(self, cmd):
+        self.sent.append(cmd)
+
+    def read(self):
+        self.sent.append("<read>")
+        return "0"
+
+    def query(self, cmd):
+        self.sent.append(cmd)
+        if self.fail:
+            raise TimeoutError("VI_ERROR_TMO")
+        return "1"
+
+    def query_binary_values(self, cmd, **kwargs):
+        self.sent.append(cmd)
+        return [1.0, 2.0]
+
+    def read_raw(self):
+        self.sent.append("<read_raw>")
+        return b"#14\x00\x00\x80?"
+
+
+@pytest.fixture
+def visa_com(monkeypatch):
+    class StubRM:
+        def open_resource(self, addrs, **kwargs):
+            return StubResource()
+
+    monkeypatch.setattr(visa_coms.pyvisa, "ResourceManager", StubRM)
+    return visa_coms.VisaCOM(addrs="TCPIP::0.0.0.0::INSTR")
+
+
+def test_batch(visa_com):
+    with visa_com.batch():
+        visa_com.write(":A 1")
+        visa_com.write("B:C 2")
+        assert visa_com.com.sent == []
+    visa_com.write(":D")
+    assert visa_com.com.sent == [":A 1;:B:C 2;*OPC?", ":D"]
+
+
+def test_batch_flushed_before_reads(visa_com):
+    with visa_com.batch():
+        visa_com.write(":A")
+        visa_com.query(":B?")
+        visa_com.write(":C")
+        visa_com.read()
+        visa_com.write(":D")
+        visa_com.query_binary_values(":E?", datatype="f")
+        visa_com.write(":F")
+        assert visa_com.query_raw(":G?") == b"#14\x00\x00\x80?"
+    assert visa_com.com.sent == [
+        ":A;*OPC?",
+        ":B?",
+        ":C;*OPC?",
+        "<read>",
+        ":D;*OPC?",
+        ":E?",
+        ":F;*OPC?",
+        ":G?",
+        "<read_raw>",
+    ]
+
+
+def test_batch_nested(visa_com):
+    with visa_com.batch():
+        visa_com.write(":OUTER")
+        with visa_com.batch():
+            visa_com.write(":INNER")
+        assert visa_com.com.sent == []
+    assert visa_com.com.sent == [":OUTER;:INNER;*OPC?"]
+
+
+def test_batch_exception(visa_com):
+    with visa_com.batch():
+        visa_com.write(":OUTER")
+        with pytest.raises(ValueError):
+            with visa_com.batch():
+                visa_com.write(":INNER")
+                raise ValueError
+    assert visa_com.com.sent == [":OUTER;*OPC?"]
+
+    with pytest.raises(ValueError):
+        with visa_com.batch():
+            visa_com.write(":DISCARDED")
+            raise ValueError
+    visa_com.write(":A")
+    assert visa_com.com.sent == [":OUTER;*OPC?", ":A"]
+
+
+def test_batch_failed_flush(visa_com):
+    visa_com.com.fail = True
+    with pytest.raises(TimeoutError):
+        with visa_com.batch():
+            visa_com.write(":A")
+
+    visa_com.write(":B")
+    assert visa_com.com.sent == [":A;*OPC?", ":B"]
+
+
+def test_end_batch_unbalanced(visa_com):
+    with pytest.raises(RuntimeError, match="without a matching begin_batch"):
+        visa_com.end_batch()
+
+    visa_com.begin_batch()
+    visa_com.end_batch()
+    with pytest.raises(RuntimeError):
+        visa_com.end_batch()
+    visa_com.write(":A")
+    assert visa_com.com.sent == [":A"]
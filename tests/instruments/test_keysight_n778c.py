@@ -0,0 +1,131 @@
+import asyncio
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from autosweep.instruments.coms.base_com import BaseCOM
+from autosweep.instruments.optical import KeysightN778C
+
+WL_BOUNDS_QUERY = ":POL:WAV? MIN;:POL:WAV? MAX"
+
+
+class StubCOM(BaseCOM):
+    def __init__(self, replies: dict):
+        super().__init__()
+        self.replies = {
+            "*IDN?": "Keysight Technologies,N7786C,MY00000000,V2.022",
+            ":SYSTEM:ERROR?": '+0,"No error"',
+            WL_BOUNDS_QUERY: "1.26E-6;1.64E-6",
+        } | replies
+        self.sent = []
+
+    def write(self, cmd: str):
+        self.sent.append(cmd)
+
+    def query(self, cmd: str) -> str:
+        self.sent.append(cmd)
+        return self.replies[cmd]
+
+
+class SlowCOM(StubCOM):
+    """Takes a while to answer and records how many queries overlapped."""
+
+    def __init__(self, replies: dict):
+        super().__init__(replies)
+        self._active_lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+
+    def query(self, cmd: str) -> str:
+        with self._active_lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(0.05)
+        with self._active_lock:
+            self.active -= 1
+        return super().query(cmd)
+
+
+@pytest.fixture
+def make_instr(monkeypatch):
+    def make(com_cls=StubCOM, **replies):
+        com = com_cls(replies)
+        monkeypatch.setattr(KeysightN778C.visa_coms, "VisaCOM", lambda addrs: com)
+        return KeysightN778C.KeysightN778C(addrs="stub"), com
+
+    return make
+
+
+def test_wl_bounds_cache(make_instr):
+    instr, com = make_instr()
+    assert com.sent.count(WL_BOUNDS_QUERY) == 1
+
+    instr.set_wavelength_nm(1550)
+    instr.set_min_wavelength_nm(1500)
+    instr.set_max_wavelength_nm(1600)
+    with pytest.raises(ValueError):
+        instr.set_wavelength_nm(1700)
+    assert com.sent.count(WL_BOUNDS_QUERY) == 1
+
+    instr.invalidate_wl_cache()
+    instr.set_wavelength_nm(1550)
+    assert com.sent.count(WL_BOUNDS_QUERY) == 2
+    assert com.sent[-1] == ":POL:WAV 1550NM"
+
+
+def test_fetch_stokes_params_async_serialised(make_instr):
+    instr, com = make_instr(com_cls=SlowCOM)
+    com.replies[":POL:SOP:FETCH?"] = "2,1,0,-1"
+
+    async def fetch_twice():
+        return await asyncio.gather(
+            instr.fetch_stokes_params_async(),
+            instr.fetch_stokes_params_async(normalized=False),
+        )
+
+    norm, raw = asyncio.run(fetch_twice())
+    np.testing.assert_array_equal(norm, [0.5, 0, -0.5])
+    np.testing.assert_array_equal(raw, [2, 1, 0, -1])
+    assert com.max_active == 1
+
+
+@pytest.mark.parametrize("normalized", [True, False])
+def test_stokes_params_size(make_instr, normalized):
+    instr, com = make_instr()
+    com.replies[":POL:SOP?"] = "2,1,0,-1\n"
+    assert instr.measure_stokes_params(normalized).size == (3 if normalized else 4)
+
+    for resp in ("2,1,0", "2,1,0,-1,5", ""):
+        com.replies[":POL:SOP?"] = resp
+        with pytest.raises(ValueError, match="Expected 4 stokes parameters"):
+            instr.measure_stokes_params(normalized)
+
+
+def test_stabilizer_target_size(make_instr):
+    instr, com = make_instr()
+    com.replies[":STAB:SOP?"] = "1,0,0\n"
+    np.testing.assert_array_equal(
+        instr.ask_stabilizer_stokes_params_target(), [1, 0, 0]
+    )
+
+    for resp in ("1,0", "1,0,0,0"):
+        com.replies[":STAB:SOP?"] = resp
+        with pytest.raises(ValueError, match="Expected 3 stokes parameters"):
+            instr.ask_stabilizer_stokes_params_target()
+
+
+@pytest.mark.parametrize(
+    ("resp", "unit"), [("0", "dBm"), ("1", "Watts"), ("+1\n", "Watts")]
+)
+def test_ask_optical_power_unit(make_instr, resp, unit):
+    instr, _ = make_instr(**{":POL:POW:UNIT?": resp})
+    assert instr.ask_optical_power_unit() == unit
+
+
+@pytest.mark.parametrize("resp", ["-1", "2"])
+def test_ask_optical_power_unit_out_of_range(make_instr, resp):
+    instr, _ = make_instr(**{":POL:POW:UNIT?": resp})
+    with pytest.raises(ValueError, match="Unexpected power unit"):
+        instr.ask_optical_power_unit()
@@ -1,7 +1,8 @@
 import matplotlib.pyplot as plt
 import numpy as np
+import pytest
 
-from autosweep.sweep.sweep_parser import Sweep
+from autosweep.sweep.sweep_parser import Sweep, SweepXY
 from autosweep.utils.logger import init_logger
 
 v = np.linspace(-1, 1, 11)
@@ -38,3 +39,79 @@ labels = s.get_axis_labels()
 ax.set_xlabel(labels["x"])
 ax.set_ylabel(labels["y"])
 plt.show()
+
+
+def test_sweep_ranges():
+    s = Sweep(traces={"v": v, "i0": i0, "i1": [3, -2, 1, 0, 0, 0, 0, 0, 0, 0, 0]})
+    assert s.ranges["v"] == (-1, 1)
+    assert s.ranges["i0"] == (-0.1, 0.1)
+    assert s.ranges["i1"] == (-2, 3)
+
+    with pytest.raises(ValueError, match="'i1'"):
+        Sweep(traces={"v": v, "i0": i0, "i1": i1[:-1]})
+
+
+def test_sweep_getitem():
+    # aliases take precedence over trace names
+    s = Sweep(traces={"y": v, "x": i0})
+    np.testing.assert_array_equal(s["x"], v)
+    np.testing.assert_array_equal(s["y"], i0)
+    np.testing.assert_array_equal(s["y0"], i0)
+
+    with pytest.raises(KeyError, match="'z'"):
+        s["z"]
+
+
+def test_sweep_xy():
+    s = Sweep.create(traces={"v": v, "i0": i0}, attrs={"v": "V", "i0": "I"})
+    assert isinstance(s, SweepXY)
+    assert isinstance(Sweep.create(traces={"v": v, "i0": i0, "i1": i1}), Sweep)
+    assert not isinstance(Sweep.create(traces={"v": v, "i0": i0, "i1": i1}), SweepXY)
+
+    np.testing.assert_array_equal(s["x"], v)
+    np.testing.assert_array_equal(s["i0"], i0)
+    s.change_unit(col="y", coeff=1000, unit="mA")
+    np.testing.assert_array_equal(s["y"], s["i0"])
+    assert isinstance(s.filter_range(x_min=-0.5, x_max=0.5), SweepXY)
+
+    with pytest.raises(AttributeError):
+        s.x = i0
+    with pytest.raises(ValueError, match="exactly 2 traces"):
+        SweepXY(traces={"v": v})
+    with pytest.raises(ValueError, match="exactly 2 traces"):
+        SweepXY(traces={"v": v, "i0": i0, "i1": i1})
+
+
+def test_sweep_dtype_promotion():
+    s = Sweep(traces={"x": np.arange(3), "y": np.array([0.5, 1.5, 2.5])})
+    assert s["x"].dtype == np.float64
+    np.testing.assert_array_equal(s["x"], [0, 1, 2])
+
+
+def test_sweep_monotonic_x():
+    s = Sweep(traces={"v": v[::-1], "i0": i0, "i1": i1}, monotonic_x=True)
+    assert s.ranges == Sweep(traces={"v": v[::-1], "i0": i0, "i1": i1}).ranges
+
+
+def test_sweep_change_unit():
+    x = np.arange(4.0)
+    s = Sweep(traces={"x": x, "y": 2 * x})
+    y = s["y"]
+    s.change_unit(col="y", coeff=0.5)
+
+    # scaled in place, the input is untouched but views of the sweep follow
+    np.testing.assert_array_equal(x, np.arange(4.0))
+    np.testing.assert_array_equal(y, x)
+
+
+def test_sweep_change_unit_promotion():
+    x = np.arange(4)
+    s = Sweep(traces={"x": x, "y": 2 * x, "z": 3 * x})
+    y = s["y"]
+    s.change_unit(col="y", coeff=0.5)
+
+    # every trace is promoted into a new array, previous views are left as they were
+    assert s["z"].dtype == np.float64
+    np.testing.assert_array_equal(s["y"], x)
+    np.testing.assert_array_equal(y, 2 * x)
+    np.testing.assert_array_equal(x, np.arange(4))